@@ -13,9 +13,17 @@ from homeassistant.components.bluetooth import (
     async_discovered_service_info,
 )
 from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DEVICE_NAME_PREFIX, DOMAIN
+from .const import (
+    CONF_IDLE_TIMEOUT,
+    CONNECTION_IDLE_TIMEOUT,
+    CONNECTION_IDLE_TIMEOUT_MAX,
+    CONNECTION_IDLE_TIMEOUT_MIN,
+    DEVICE_NAME_PREFIX,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,18 +36,29 @@ class HomedicsSereneScentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    # Schema key for the device picker; only the choices change per render
+    _ADDRESS_KEY = vol.Required(CONF_ADDRESS)
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> HomedicsSereneScentOptionsFlow:
+        """Return the options flow handler."""
+        return HomedicsSereneScentOptionsFlow(config_entry)
+
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._discovered_devices: dict[str, BluetoothServiceInfoBleak] = {}
         self._discovery_info: BluetoothServiceInfoBleak | None = None
 
-    def _get_configured_addresses(self) -> set[str]:
+    def _get_configured_addresses(self) -> frozenset[str]:
         """Get set of already configured device addresses."""
-        return {
-            entry.data.get(CONF_ADDRESS)
+        return frozenset(
+            address
             for entry in self._async_current_entries()
-            if entry.data.get(CONF_ADDRESS)
-        }
+            if (address := entry.data.get(CONF_ADDRESS))
+        )
 
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
@@ -107,23 +126,18 @@ class HomedicsSereneScentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data={CONF_ADDRESS: address},
             )
 
-        # Get already configured addresses
-        configured_addresses = self._get_configured_addresses()
-        current_flow_ids = self._async_current_ids()
+        # Skip addresses that are already configured or in another flow
+        excluded = self._get_configured_addresses() | frozenset(
+            self._async_current_ids()
+        )
 
         # Scan for all SereneScent devices
         self._discovered_devices = {}
         for discovery_info in async_discovered_service_info(self.hass):
-            # Skip if already configured
-            if discovery_info.address in configured_addresses:
-                continue
-
-            # Skip if already in another flow
-            if discovery_info.address in current_flow_ids:
-                continue
-
-            # Skip if already in our list
-            if discovery_info.address in self._discovered_devices:
+            if (
+                discovery_info.address in excluded
+                or discovery_info.address in self._discovered_devices
+            ):
                 continue
 
             # Check if it's a SereneScent device
@@ -144,17 +158,16 @@ class HomedicsSereneScentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._discovery_info = self._discovered_devices[address]
             return await self.async_step_bluetooth_confirm()
 
-        # Multiple devices found - let user select
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_ADDRESS): vol.In(
-                    {
-                        address: f"{info.name} ({address})"
-                        for address, info in self._discovered_devices.items()
-                    }
-                )
-            }
-        )
+        # Multiple devices found - let user select (sorted by name for a
+        # stable list between renders)
+        choices = {
+            address: f"{info.name} ({address})"
+            for address, info in sorted(
+                self._discovered_devices.items(),
+                key=lambda item: (item[1].name, item[0]),
+            )
+        }
+        data_schema = vol.Schema({self._ADDRESS_KEY: vol.In(choices)})
 
         return self.async_show_form(
             step_id="user",
@@ -165,11 +178,49 @@ class HomedicsSereneScentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
     @staticmethod
-    def _is_homedics_device(name: str | None) -> bool:
+    def _is_homedics_device(
+        name: str | None, _prefix: str = DEVICE_NAME_PREFIX
+    ) -> bool:
         """Check if device name matches Homedics SereneScent pattern.
 
         Device advertises as 'ARPRP-xxx' where xxx is device-specific.
+        The prefix is bound as a default so it is a local lookup per call.
         """
-        if name is None:
-            return False
-        return name.startswith(DEVICE_NAME_PREFIX)
+        return name is not None and name.startswith(_prefix)
+
+
+class HomedicsSereneScentOptionsFlow(config_entries.OptionsFlow):
+    """Handle options for Homedics SereneScent.
+
+    Lets the user trade reconnect cost against keeping the device busy by
+    tuning how long the connection is kept open after a command.
+    """
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        idle_timeout = self._entry.options.get(
+            CONF_IDLE_TIMEOUT, CONNECTION_IDLE_TIMEOUT
+        )
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_IDLE_TIMEOUT, default=idle_timeout): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(
+                            min=CONNECTION_IDLE_TIMEOUT_MIN,
+                            max=CONNECTION_IDLE_TIMEOUT_MAX,
+                        ),
+                    )
+                }
+            ),
+        )
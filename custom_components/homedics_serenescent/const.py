@@ -10,20 +10,27 @@ PLATFORMS = [Platform.FAN, Platform.LIGHT, Platform.SWITCH]
 
 # Configuration
 CONF_MAC_ADDRESS = "mac_address"
+CONF_IDLE_TIMEOUT = "idle_timeout"
 
-# Device names that we look for during discovery
-DEVICE_NAME_PREFIX = "ARMH-"  # Actual device advertises as ARPRP-xxx
+# Device names that we look for during discovery. The ARMH-973 model
+# advertises as ARPRP-xxx. Must stay in sync with the local_name matcher
+# in manifest.json.
+DEVICE_NAME_PREFIX = "ARPRP-"
 
 # Update interval
 DEFAULT_SCAN_INTERVAL = 30  # seconds
 
 # Connection management
-CONNECTION_IDLE_TIMEOUT = 120  # seconds - disconnect after this much idle time
+CONNECTION_IDLE_TIMEOUT = 120  # seconds - default time to stay connected after the last command
+CONNECTION_IDLE_TIMEOUT_MIN = 10  # seconds - lowest idle timeout allowed in options
+CONNECTION_IDLE_TIMEOUT_MAX = 3600  # seconds - highest idle timeout allowed in options
 CONNECTION_TIMEOUT = 8.0  # seconds - timeout for each connection attempt
 CONNECTION_MAX_ATTEMPTS = 2  # Maximum connection retry attempts (fail fast)
 CONNECTION_MAX_DELAY = 2.0  # Maximum retry delay in seconds
 CONNECTION_DELAY_REDUCTION = 0.75  # Multiply delay by this on success
-COMMAND_DELAY = 0.2  # seconds between commands
+ADVERTISEMENT_STALE_TIMEOUT = 2 * DEFAULT_SCAN_INTERVAL  # seconds - max advert age to connect
+COMMAND_DELAY = 0.2  # seconds between commands, matching the app's spacing
+COMMAND_DEBOUNCE = 0.05  # seconds to collect bursts of changes to the same field
 
 # BLE Service and Characteristic UUIDs (from protocol reverse engineering)
 SERVICE_UUID = "53527aa4-29f7-ae11-4e74-997334782568"
@@ -36,6 +43,7 @@ ADVERTISED_SERVICE_UUID = "0000fff0-0000-1000-8000-00805f9b34fb"
 # Protocol command header
 CMD_HEADER = bytes([0xFF, 0xFA])
 RESP_HEADER = bytes([0xFF, 0xFB])
+RESP_STATUS_PREFIX = RESP_HEADER + bytes([0x40])  # Status query echo
 
 # Power commands
 CMD_POWER_ON = bytes([0xFF, 0xFA, 0x10, 0x04])
@@ -86,11 +94,8 @@ INTENSITY_LOW = 10
 INTENSITY_MEDIUM = 20
 INTENSITY_HIGH = 30
 
-INTENSITY_MAP = {
-    INTENSITY_LOW: "low",
-    INTENSITY_MEDIUM: "medium",
-    INTENSITY_HIGH: "high",
-}
+# Indexed by intensity value // 10 - 1
+INTENSITY_NAMES = ("low", "medium", "high")
 
 INTENSITY_COMMANDS = {
     "low": CMD_INTENSITY_LOW,
@@ -108,16 +113,17 @@ COLOR_VIOLET = 5
 COLOR_GREEN = 6
 COLOR_ORANGE = 7
 
-COLOR_MAP = {
-    COLOR_OFF: "off",
-    COLOR_ROTATING: "rotating",
-    COLOR_WHITE: "white",
-    COLOR_RED: "red",
-    COLOR_BLUE: "blue",
-    COLOR_VIOLET: "violet",
-    COLOR_GREEN: "green",
-    COLOR_ORANGE: "orange",
-}
+# Indexed by color value (COLOR_OFF..COLOR_ORANGE)
+COLOR_NAMES = (
+    "off",
+    "rotating",
+    "white",
+    "red",
+    "blue",
+    "violet",
+    "green",
+    "orange",
+)
 
 COLOR_COMMANDS = {
     "off": CMD_COLOR_OFF,
@@ -4,23 +4,29 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import struct
 import time
+from contextlib import suppress
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any
 
 from bleak import BleakClient
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.exc import BleakError
-from bleak_retry_connector import establish_connection
+from bleak_retry_connector import BleakNotFoundError, establish_connection
 
 from homeassistant.components import bluetooth
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
+    ADVERTISEMENT_STALE_TIMEOUT,
     CHAR_RX_UUID,
     CHAR_TX_UUID,
     CMD_MODE_HOME,
@@ -35,9 +41,11 @@ from .const import (
     CMD_SETTINGS_SYNC,
     CMD_STATUS_HOME,
     CMD_STATUS_SCHEDULE,
-    COLOR_COMMANDS,
-    COLOR_MAP,
+    COMMAND_DEBOUNCE,
     COMMAND_DELAY,
+    CONF_IDLE_TIMEOUT,
+    COLOR_COMMANDS,
+    COLOR_NAMES,
     CONNECTION_DELAY_REDUCTION,
     CONNECTION_IDLE_TIMEOUT,
     CONNECTION_MAX_ATTEMPTS,
@@ -46,8 +54,8 @@ from .const import (
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     INTENSITY_COMMANDS,
-    INTENSITY_MAP,
-    RESP_HEADER,
+    INTENSITY_NAMES,
+    RESP_STATUS_PREFIX,
     STATUS_BYTE_COLOR,
     STATUS_BYTE_INTENSITY,
     STATUS_BYTE_MODE,
@@ -57,12 +65,49 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Indexed by mode (0=HOME, 1=SCHEDULE)
+_MODE_SWITCH_COMMANDS = ((CMD_MODE_HOME,), (CMD_MODE_SCHEDULE, CMD_SCHEDULE_SYNC))
+_STATUS_COMMANDS = (CMD_STATUS_HOME, CMD_STATUS_SCHEDULE)
+
+# 16-byte status response: 3-byte prefix, then the intensity, color,
+# schedule, power and mode bytes at their offsets (padding in between)
+_STATUS_STRUCT = struct.Struct(
+    f"3s{STATUS_BYTE_INTENSITY - 3}xB"
+    f"{STATUS_BYTE_COLOR - STATUS_BYTE_INTENSITY - 1}xB"
+    f"{STATUS_BYTE_SCHEDULE - STATUS_BYTE_COLOR - 1}xB"
+    f"{STATUS_BYTE_POWER - STATUS_BYTE_SCHEDULE - 1}xB"
+    f"{STATUS_BYTE_MODE - STATUS_BYTE_POWER - 1}xB"
+)
+
+# Status byte value -> name, with the defaults for unknown values filled in
+_INTENSITY_LUT = tuple(
+    INTENSITY_NAMES[value // 10 - 1]
+    if value % 10 == 0 and 1 <= value // 10 <= len(INTENSITY_NAMES)
+    else "low"
+    for value in range(256)
+)
+_COLOR_LUT = tuple(
+    COLOR_NAMES[value] if value < len(COLOR_NAMES) else "white"
+    for value in range(256)
+)
+
+
+@dataclass(slots=True)
+class DeviceState:
+    """Last known state of the diffuser, as reported by a status response."""
+
+    mode: int = 0  # 0=HOME, 1=SCHEDULE
+    is_on: bool = False
+    intensity: str = "low"
+    color: str = "white"
+    schedule_on: bool = False
+
 
 class HomedicsSereneScentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for Homedics SereneScent BLE communication.
 
     Manages BLE connection, sends commands, and parses status responses.
-    Uses a command queue to serialize device communication.
+    Command batches and polls are serialized by _command_lock.
     """
 
     def __init__(
@@ -80,26 +125,32 @@ class HomedicsSereneScentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=f"{DOMAIN}_{self.address}",
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # Only notify entities when a poll actually changes the state
+            always_update=False,
         )
 
         # Connection management
         self._client: BleakClient | None = None
+        self._tx_char: BleakGATTCharacteristic | str = CHAR_TX_UUID
         self._connection_lock = asyncio.Lock()
-        self._last_activity_time: float = 0
+        self._command_lock = asyncio.Lock()  # Serializes command batches
+        self._change_seq: dict[str, int] = {}  # Latest change request per field
+        self._idle_timer: asyncio.TimerHandle | None = None
+        self._idle_timeout: int = config_entry.options.get(
+            CONF_IDLE_TIMEOUT, CONNECTION_IDLE_TIMEOUT
+        )
 
         # Response handling
-        self._response_event = asyncio.Event()
-        self._last_response: bytes | None = None
+        # Future resolved by the notification handler when the device echoes
+        # the command byte in _pending_cmd_id
+        self._pending_response: asyncio.Future[bytes] | None = None
+        self._pending_cmd_id: int = 0
 
         # Device state tracking
-        self._current_mode: int = 0  # 0=HOME, 1=SCHEDULE
-        self._is_on: bool = False
-        self._intensity: str = "low"
-        self._color: str = "white"
-        self._schedule_on: bool = False
-
-        # Background tasks
-        self._health_monitor_task: asyncio.Task | None = None
+        self._state = DeviceState()
+        self._status_cmd: bytes = CMD_STATUS_HOME  # Status query for current mode
+        self._mode_confirmed: bool = False  # Mode reported on this connection
+        self._status_seq: int = 0  # Incremented on each parsed status response
 
         # Monitoring state
         self._monitoring_enabled: bool = True
@@ -126,36 +177,47 @@ class HomedicsSereneScentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     @property
     def is_on(self) -> bool:
         """Return True if device is on."""
-        return self._is_on
+        return self._state.is_on
 
     @property
     def intensity(self) -> str:
         """Return current intensity level."""
-        return self._intensity
+        return self._state.intensity
 
     @property
     def color(self) -> str:
         """Return current color."""
-        return self._color
+        return self._state.color
 
     @property
     def schedule_on(self) -> bool:
         """Return True if schedule is enabled."""
-        return self._schedule_on
+        return self._state.schedule_on
 
     async def _ensure_connected(self) -> BleakClient:
         """Ensure BLE connection is active."""
+        # Fast path: already connected, no need to take the lock
+        if self._client and self._client.is_connected:
+            return self._client
+
         async with self._connection_lock:
             if self._client and self._client.is_connected:
                 return self._client
 
-            ble_device = bluetooth.async_ble_device_from_address(
+            service_info = bluetooth.async_last_service_info(
                 self.hass, self.address, connectable=True
             )
 
-            if not ble_device:
+            if not service_info:
                 raise UpdateFailed(f"Device {self.address} not found")
 
+            # Fail fast instead of running the retry loop against a device
+            # that has stopped advertising (e.g. connected to another app)
+            if time.monotonic() - service_info.time > ADVERTISEMENT_STALE_TIMEOUT:
+                raise UpdateFailed(f"Device {self.address} is not advertising")
+
+            ble_device = service_info.device
+
             last_error: Exception | None = None
             for attempt in range(CONNECTION_MAX_ATTEMPTS):
                 try:
@@ -173,21 +235,23 @@ class HomedicsSereneScentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         timeout=CONNECTION_TIMEOUT,
                     )
 
+                    # Resolve characteristics once so each write doesn't
+                    # repeat the UUID lookup in bleak's service table
+                    services = self._client.services
+                    self._tx_char = (
+                        services.get_characteristic(CHAR_TX_UUID) or CHAR_TX_UUID
+                    )
+
                     # Subscribe to notifications
                     await self._client.start_notify(
-                        CHAR_RX_UUID, self._notification_handler
+                        services.get_characteristic(CHAR_RX_UUID) or CHAR_RX_UUID,
+                        self._notification_handler,
                     )
 
                     self._connect_delay = max(
                         self._connect_delay * CONNECTION_DELAY_REDUCTION, 0
                     )
-                    self._last_activity_time = time.time()
-
-                    # Start health monitor if not running
-                    if self._health_monitor_task is None or self._health_monitor_task.done():
-                        self._health_monitor_task = asyncio.create_task(
-                            self._monitor_connection_health()
-                        )
+                    self._mode_confirmed = False
 
                     _LOGGER.debug("Connected to %s", self.address)
                     return self._client
@@ -203,6 +267,12 @@ class HomedicsSereneScentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         CONNECTION_MAX_ATTEMPTS,
                     )
 
+                except BleakNotFoundError as err:
+                    # Device is gone - retrying won't help, let the next poll try
+                    last_error = err
+                    _LOGGER.debug("Device %s not found: %s", self.address, err)
+                    break
+
                 except BleakError as err:
                     last_error = err
                     _LOGGER.debug("Connection attempt %d failed: %s", attempt + 1, err)
@@ -215,12 +285,14 @@ class HomedicsSereneScentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         self._connect_delay = min(
                             self._connect_delay * 2, CONNECTION_MAX_DELAY
                         )
-                    await asyncio.sleep(self._connect_delay)
+                    # Jitter the delay so retries against a device that just went
+                    # offline don't line up
+                    await asyncio.sleep(self._connect_delay * (0.5 + random.random()))
 
             _LOGGER.warning(
                 "Failed to connect to %s after %d attempts: %s",
                 self.address,
-                CONNECTION_MAX_ATTEMPTS,
+                attempt + 1,
                 last_error,
             )
             raise HomeAssistantError(
@@ -230,11 +302,11 @@ class HomedicsSereneScentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _disconnect(self) -> None:
         """Disconnect from device."""
         async with self._connection_lock:
+            self._cancel_idle_timer()
+            self._mode_confirmed = False
             if self._client and self._client.is_connected:
-                try:
+                with suppress(BleakError):
                     await self._client.stop_notify(CHAR_RX_UUID)
-                except BleakError:
-                    pass
                 try:
                     await self._client.disconnect()
                 except BleakError as err:
@@ -244,237 +316,248 @@ class HomedicsSereneScentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _notification_handler(self, sender: int, data: bytes) -> None:
         """Handle BLE notifications from device."""
-        if all(b == 0xFF for b in data) or all(b == 0 for b in data):
+        if not data.translate(None, b"\xff") or not data.translate(None, b"\x00"):
             return  # Ignore empty/filler responses
 
-        _LOGGER.debug("Received: %s", data.hex())
-        self._last_response = bytes(data)
-        self._response_event.set()
-
-    async def _send_command(self, cmd: bytes, wait_response: bool = True) -> bytes | None:
-        """Send command to device and optionally wait for response."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received: %s", data.hex())
+
+        # Acknowledgments for earlier commands in a batch may arrive late,
+        # so only a response echoing the awaited command resolves the future
+        future = self._pending_response
+        if (
+            future is not None
+            and not future.done()
+            and len(data) > 2
+            and data[2] == self._pending_cmd_id
+        ):
+            future.set_result(bytes(data))
+
+    async def _send_batch(self, cmds: list[tuple[bytes, bool]]) -> bytes | None:
+        """Send a sequence of commands over a single connection.
+
+        Each entry is (command, wait_response). Commands that don't wait are
+        followed by COMMAND_DELAY, like the app spaces its sequences;
+        waiting commands block until the device echoes that command.
+        Returns the last response received. Callers must hold _command_lock.
+        """
         client = await self._ensure_connected()
 
-        self._response_event.clear()
-        self._last_response = None
+        response: bytes | None = None
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        for cmd, wait_response in cmds:
+            if wait_response:
+                self._pending_cmd_id = cmd[2]
+                self._pending_response = self.hass.loop.create_future()
 
-        _LOGGER.debug("Sending: %s", cmd.hex())
-        await client.write_gatt_char(CHAR_TX_UUID, cmd, response=False)
-
-        self._last_activity_time = time.time()
-
-        if wait_response:
+            if debug_enabled:
+                _LOGGER.debug("Sending: %s", cmd.hex())
             try:
-                await asyncio.wait_for(self._response_event.wait(), timeout=2.0)
-                return self._last_response
-            except asyncio.TimeoutError:
-                _LOGGER.debug("No response received for command")
-                return None
+                await client.write_gatt_char(self._tx_char, cmd, response=False)
 
-        await asyncio.sleep(COMMAND_DELAY)
-        return None
+                if wait_response:
+                    try:
+                        response = await asyncio.wait_for(
+                            self._pending_response, timeout=2.0
+                        )
+                    except asyncio.TimeoutError:
+                        _LOGGER.debug("No response received for command")
+                        response = None
+                else:
+                    await asyncio.sleep(COMMAND_DELAY)
+            finally:
+                self._pending_response = None
+
+        return response
 
     def _parse_status_response(self, data: bytes) -> None:
         """Parse 16-byte status response."""
-        if len(data) < 16:
+        if len(data) < _STATUS_STRUCT.size:
             _LOGGER.debug("Status response too short: %d bytes", len(data))
             return
 
-        if data[0:2] != RESP_HEADER or data[2] != 0x40:
+        prefix, intensity_val, color_val, schedule_val, power_val, mode_val = (
+            _STATUS_STRUCT.unpack_from(data)
+        )
+        if prefix != RESP_STATUS_PREFIX:
             _LOGGER.debug("Not a status response: %s", data.hex())
             return
 
-        # Parse intensity
-        intensity_val = data[STATUS_BYTE_INTENSITY]
-        self._intensity = INTENSITY_MAP.get(intensity_val, "low")
-
-        # Parse color
-        color_val = data[STATUS_BYTE_COLOR]
-        self._color = COLOR_MAP.get(color_val, "white")
-
-        # Parse schedule status
-        self._schedule_on = data[STATUS_BYTE_SCHEDULE] == 1
-
-        # Parse power status
-        self._is_on = data[STATUS_BYTE_POWER] == 1
-
-        # Parse mode
-        self._current_mode = data[STATUS_BYTE_MODE]
+        state = self._state
+        state.intensity = _INTENSITY_LUT[intensity_val]
+        state.color = _COLOR_LUT[color_val]
+        state.schedule_on = schedule_val == 1
+        state.is_on = power_val == 1
+        self._set_mode(mode_val)
+        self._mode_confirmed = True
+        self._status_seq += 1
 
         _LOGGER.debug(
             "Status: power=%s, intensity=%s, color=%s, schedule=%s, mode=%d",
-            self._is_on,
-            self._intensity,
-            self._color,
-            self._schedule_on,
-            self._current_mode,
+            state.is_on,
+            state.intensity,
+            state.color,
+            state.schedule_on,
+            state.mode,
         )
 
+    def _set_mode(self, mode: int) -> None:
+        """Track the device mode and the matching status query."""
+        if mode != self._state.mode:
+            self._state.mode = mode
+            self._status_cmd = _STATUS_COMMANDS[mode == 1]
+
     async def async_request_status(self) -> bool:
         """Request current status from device.
 
-        Returns True if a valid status response was received.
+        Returns True if a valid status response was received. Command
+        batches end with their own status query, so if one completed while
+        waiting for the lock its response is used instead of polling again.
         """
-        cmd = CMD_STATUS_SCHEDULE if self._current_mode == 1 else CMD_STATUS_HOME
-        response = await self._send_command(cmd)
+        status_seq = self._status_seq
+        async with self._command_lock:
+            if self._status_seq != status_seq:
+                return True
+            return self._handle_status_response(
+                await self._send_batch([(self._status_cmd, True)])
+            )
+
+    def _handle_status_response(self, response: bytes | None) -> bool:
+        """Parse a status response if one was received."""
         if response:
             self._parse_status_response(response)
             return True
         return False
 
-    async def async_set_power(self, on: bool) -> None:
-        """Turn device on or off."""
+    async def _apply_change(
+        self,
+        field: str,
+        expected: Any,
+        mode: int,
+        cmds: list[bytes],
+    ) -> None:
+        """Send commands in the given mode and confirm the result.
+
+        The mode switch is only sent when the device is known to be in
+        another mode or hasn't reported its mode on this connection yet.
+        The batch ends with a status query; the change is confirmed when
+        the reported data dict has `expected` under `field`.
+
+        Rapid changes to the same field (e.g. dragging a slider) are
+        coalesced: after a short debounce only the newest one is sent.
+        """
+        seq = self._change_seq[field] = self._change_seq.get(field, 0) + 1
+        await asyncio.sleep(COMMAND_DEBOUNCE)
+
+        # Drop superseded changes before queueing on the lock so a burst
+        # leaves at most one waiter per field
+        if self._change_seq[field] != seq:
+            _LOGGER.debug("Skipping superseded %s change", field)
+            return
+
+        async with self._command_lock:
+            if self._change_seq[field] != seq:
+                _LOGGER.debug("Skipping superseded %s change", field)
+                return
+            await self._apply_change_locked(field, expected, mode, cmds)
+
+    async def _apply_change_locked(
+        self,
+        field: str,
+        expected: Any,
+        mode: int,
+        cmds: list[bytes],
+    ) -> None:
+        """Send and confirm a change while holding _command_lock."""
         try:
-            # Ensure HOME mode for power commands
-            if self._current_mode != 0:
-                await self._send_command(CMD_MODE_HOME, wait_response=False)
-                self._current_mode = 0
+            # Connect first: a reconnect after the link dropped on its own
+            # clears _mode_confirmed, which decides the mode switch below
+            await self._ensure_connected()
 
-            cmd = CMD_POWER_ON if on else CMD_POWER_OFF
-            await self._send_command(cmd)
+            batch: list[tuple[bytes, bool]] = []
+            if self._state.mode != mode or not self._mode_confirmed:
+                batch.extend((cmd, False) for cmd in _MODE_SWITCH_COMMANDS[mode])
+            batch.extend((cmd, False) for cmd in cmds)
+            batch.append((_STATUS_COMMANDS[mode], True))
 
-            # Request status to confirm
-            status_ok = await self.async_request_status()
-            await self._disconnect()
+            response = await self._send_batch(batch)
+            # Keep the connection for follow-up commands (e.g. slider drags)
+            self._reset_idle_timer()
+            self._set_mode(mode)
 
             # Verify we got a response and state changed
-            if not status_ok:
+            if not self._handle_status_response(response):
                 raise HomeAssistantError(
                     "No response from device - may be in use by another app"
                 )
-            if self._is_on != on:
+            data = self._build_data_dict()
+            if data[field] != expected:
                 raise HomeAssistantError(
                     "Command failed - device state did not change"
                 )
 
-            self.async_set_updated_data(self._build_data_dict())
+            # Skip the entity update if a confirmed command changed nothing
+            if data != self.data or not self.last_update_success:
+                self.async_set_updated_data(data)
         except (BleakError, HomeAssistantError) as err:
             await self._disconnect()
-            _LOGGER.warning("Failed to set power: %s", err)
-            raise HomeAssistantError(f"Failed to set power: {err}") from err
+            _LOGGER.warning("Failed to set %s: %s", field, err)
+            raise HomeAssistantError(f"Failed to set {field}: {err}") from err
+
+    async def async_set_power(self, on: bool) -> None:
+        """Turn device on or off."""
+        cmd = CMD_POWER_ON if on else CMD_POWER_OFF
+        await self._apply_change("power", on, 0, [cmd])
 
     async def async_set_intensity(self, intensity: str) -> None:
         """Set diffuser intensity (low, medium, high)."""
-        if intensity not in INTENSITY_COMMANDS:
+        if (cmd := INTENSITY_COMMANDS.get(intensity)) is None:
             _LOGGER.warning("Invalid intensity: %s", intensity)
             return
 
-        try:
-            # Ensure HOME mode
-            if self._current_mode != 0:
-                await self._send_command(CMD_MODE_HOME, wait_response=False)
-                self._current_mode = 0
-
-            await self._send_command(INTENSITY_COMMANDS[intensity])
-
-            # Request status to confirm
-            status_ok = await self.async_request_status()
-            await self._disconnect()
-
-            # Verify we got a response and state changed
-            if not status_ok:
-                raise HomeAssistantError(
-                    "No response from device - may be in use by another app"
-                )
-            if self._intensity != intensity:
-                raise HomeAssistantError(
-                    "Command failed - device state did not change"
-                )
-
-            self.async_set_updated_data(self._build_data_dict())
-        except (BleakError, HomeAssistantError) as err:
-            await self._disconnect()
-            _LOGGER.warning("Failed to set intensity: %s", err)
-            raise HomeAssistantError(f"Failed to set intensity: {err}") from err
+        await self._apply_change("intensity", intensity, 0, [cmd])
 
     async def async_set_color(self, color: str) -> None:
         """Set light color."""
-        if color not in COLOR_COMMANDS:
+        if (cmd := COLOR_COMMANDS.get(color)) is None:
             _LOGGER.warning("Invalid color: %s", color)
             return
 
-        try:
-            # Ensure HOME mode
-            if self._current_mode != 0:
-                await self._send_command(CMD_MODE_HOME, wait_response=False)
-                self._current_mode = 0
-
-            await self._send_command(COLOR_COMMANDS[color])
-
-            # Request status to confirm
-            status_ok = await self.async_request_status()
-            await self._disconnect()
-
-            # Verify we got a response and state changed
-            if not status_ok:
-                raise HomeAssistantError(
-                    "No response from device - may be in use by another app"
-                )
-            if self._color != color:
-                raise HomeAssistantError(
-                    "Command failed - device state did not change"
-                )
-
-            self.async_set_updated_data(self._build_data_dict())
-        except (BleakError, HomeAssistantError) as err:
-            await self._disconnect()
-            _LOGGER.warning("Failed to set color: %s", err)
-            raise HomeAssistantError(f"Failed to set color: {err}") from err
+        await self._apply_change("color", color, 0, [cmd])
 
     async def async_set_schedule(self, on: bool) -> None:
         """Enable or disable schedule."""
-        try:
-            # Ensure SCHEDULE mode
-            if self._current_mode != 1:
-                await self._send_command(CMD_MODE_SCHEDULE, wait_response=False)
-                await self._send_command(CMD_SCHEDULE_SYNC, wait_response=False)
-                self._current_mode = 1
-
-            if on:
-                # Schedule ON requires 4-command sequence
-                await self._send_command(CMD_SCHEDULE_ON, wait_response=False)
-                await self._send_command(CMD_SETTINGS_SYNC, wait_response=False)
-                await self._send_command(CMD_SCHEDULE_UNKNOWN1, wait_response=False)
-                await self._send_command(CMD_SCHEDULE_UNKNOWN2, wait_response=False)
-            else:
-                # Schedule OFF is simpler
-                await self._send_command(CMD_SCHEDULE_OFF)
-
-            # Request status to confirm
-            status_ok = await self.async_request_status()
-            await self._disconnect()
-
-            # Verify we got a response and state changed
-            if not status_ok:
-                raise HomeAssistantError(
-                    "No response from device - may be in use by another app"
-                )
-            if self._schedule_on != on:
-                raise HomeAssistantError(
-                    "Command failed - device state did not change"
-                )
-
-            self.async_set_updated_data(self._build_data_dict())
-        except (BleakError, HomeAssistantError) as err:
-            await self._disconnect()
-            _LOGGER.warning("Failed to set schedule: %s", err)
-            raise HomeAssistantError(f"Failed to set schedule: {err}") from err
+        if on:
+            # Schedule ON requires 4-command sequence
+            cmds = [
+                CMD_SCHEDULE_ON,
+                CMD_SETTINGS_SYNC,
+                CMD_SCHEDULE_UNKNOWN1,
+                CMD_SCHEDULE_UNKNOWN2,
+            ]
+        else:
+            # Schedule OFF is simpler
+            cmds = [CMD_SCHEDULE_OFF]
+
+        await self._apply_change("schedule", on, 1, cmds)
 
     def _build_data_dict(self) -> dict[str, Any]:
         """Build data dictionary for entities."""
+        state = self._state
         return {
-            "power": self._is_on,
-            "intensity": self._intensity,
-            "color": self._color,
-            "schedule": self._schedule_on,
+            "power": state.is_on,
+            "intensity": state.intensity,
+            "color": state.color,
+            "schedule": state.schedule_on,
         }
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from device."""
         try:
             await self.async_request_status()
-            # Disconnect immediately after polling to free the device for other apps
-            await self._disconnect()
+            # Free the device for other apps unless a command was sent
+            # within the idle timeout; polls don't extend it
+            await self._async_disconnect_if_idle()
             return self._build_data_dict()
         except HomeAssistantError as err:
             await self._disconnect()
@@ -489,22 +572,39 @@ class HomedicsSereneScentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.warning("Unexpected error during status update: %s", err)
             raise UpdateFailed(f"Error: {err}") from err
 
-    async def _monitor_connection_health(self) -> None:
-        """Monitor connection and disconnect if idle."""
-        while True:
-            try:
-                await asyncio.sleep(30)
+    async def _async_disconnect_if_idle(self) -> None:
+        """Disconnect unless a command was sent within the idle timeout.
 
-                if self._client and self._client.is_connected:
-                    idle_time = time.time() - self._last_activity_time
-                    if idle_time > CONNECTION_IDLE_TIMEOUT:
-                        _LOGGER.debug("Connection idle for %ds, disconnecting", int(idle_time))
-                        await self._disconnect()
+        Holds _command_lock so a batch in flight is never cut off; a command
+        that ran while waiting for the lock restarts the idle timer.
+        """
+        async with self._command_lock:
+            if self._idle_timer is None:
+                await self._disconnect()
+
+    def _reset_idle_timer(self) -> None:
+        """(Re)start the timer that disconnects after the last command."""
+        self._cancel_idle_timer()
+        self._idle_timer = self.hass.loop.call_later(
+            self._idle_timeout, self._async_idle_timeout
+        )
 
-            except asyncio.CancelledError:
-                break
-            except Exception as err:
-                _LOGGER.error("Health monitor error: %s", err)
+    def _cancel_idle_timer(self) -> None:
+        """Cancel the idle disconnect timer if it is pending."""
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    @callback
+    def _async_idle_timeout(self) -> None:
+        """Disconnect once no command has been sent for the timeout."""
+        self._idle_timer = None
+        _LOGGER.debug(
+            "No command for %ds, disconnecting when idle", self._idle_timeout
+        )
+        # Waits for any batch in flight; a setter that gets the lock first
+        # restarts the timer and keeps the connection
+        self.hass.async_create_task(self._async_disconnect_if_idle())
 
     def start_monitoring(self) -> None:
         """Start monitoring."""
@@ -513,12 +613,5 @@ class HomedicsSereneScentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def async_disconnect(self) -> None:
         """Disconnect and cleanup."""
         self._monitoring_enabled = False
-
-        if self._health_monitor_task and not self._health_monitor_task.done():
-            self._health_monitor_task.cancel()
-            try:
-                await self._health_monitor_task
-            except asyncio.CancelledError:
-                pass
-
+        self._cancel_idle_timer()
         await self._disconnect()
@@ -11,7 +11,7 @@ from typing import Any
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.percentage import (
@@ -26,6 +26,7 @@ _LOGGER = logging.getLogger(__name__)
 
 # Map preset modes to intensity values
 PRESET_MODES = ["low", "medium", "high"]
+_PRESET_SET = frozenset(PRESET_MODES)
 
 # Speed range for percentage calculation (1=low, 2=medium, 3=high)
 SPEED_RANGE = (1, 3)
@@ -34,6 +35,19 @@ SPEED_RANGE = (1, 3)
 INTENSITY_TO_SPEED = {"low": 1, "medium": 2, "high": 3}
 SPEED_TO_INTENSITY = {1: "low", 2: "medium", 3: "high"}
 
+# Intensity for every percentage 0-100, so slider steps are a single index
+_PERCENTAGE_TO_INTENSITY = tuple(
+    SPEED_TO_INTENSITY.get(
+        math.ceil(percentage_to_ranged_value(SPEED_RANGE, percentage)), "low"
+    )
+    for percentage in range(101)
+)
+
+
+def _percentage_to_intensity(percentage: int) -> str:
+    """Return the intensity level for a speed percentage."""
+    return _PERCENTAGE_TO_INTENSITY[max(0, min(100, percentage))]
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -73,6 +87,28 @@ class HomedicsSereneScentFan(
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_fan"
         self._attr_device_info = coordinator.device_info
+        self._update_attrs()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
+
+    def _update_attrs(self) -> None:
+        """Cache power/intensity state so HA reads plain attributes.
+
+        is_on is derived by FanEntity from percentage and preset_mode.
+        """
+        if self.coordinator.is_on:
+            intensity = self.coordinator.intensity
+            self._attr_preset_mode = intensity
+            self._attr_percentage = ranged_value_to_percentage(
+                SPEED_RANGE, INTENSITY_TO_SPEED.get(intensity, 1)
+            )
+        else:
+            self._attr_preset_mode = None
+            self._attr_percentage = 0
 
     @property
     def available(self) -> bool:
@@ -83,24 +119,23 @@ class HomedicsSereneScentFan(
         """
         return self.coordinator.monitoring_enabled
 
-    @property
-    def is_on(self) -> bool:
-        """Return True if the diffuser is on."""
-        return self.coordinator.is_on
+    async def _async_turn_on_at(self, intensity: str | None) -> None:
+        """Turn on and set intensity, skipping commands that are no-ops.
 
-    @property
-    def preset_mode(self) -> str | None:
-        """Return the current preset mode (intensity level)."""
-        return self.coordinator.intensity if self.is_on else None
+        Automations often re-assert the current state; the known coordinator
+        state is used to avoid a BLE round-trip when nothing would change.
+        The cached state is only trusted after a successful update, since
+        the entity stays available while polls fail.
+        """
+        known = self.coordinator.last_update_success
 
-    @property
-    def percentage(self) -> int | None:
-        """Return the current speed as a percentage."""
-        if not self.is_on:
-            return 0
-        intensity = self.coordinator.intensity
-        speed = INTENSITY_TO_SPEED.get(intensity, 1)
-        return ranged_value_to_percentage(SPEED_RANGE, speed)
+        if not (known and self.coordinator.is_on):
+            await self.coordinator.async_set_power(True)
+
+        if intensity is not None and not (
+            known and intensity == self.coordinator.intensity
+        ):
+            await self.coordinator.async_set_intensity(intensity)
 
     async def async_turn_on(
         self,
@@ -109,45 +144,36 @@ class HomedicsSereneScentFan(
         **kwargs: Any,
     ) -> None:
         """Turn on the diffuser."""
-        await self.coordinator.async_set_power(True)
+        intensity: str | None = None
 
         # If percentage specified, convert to intensity
         if percentage is not None and percentage > 0:
-            speed = math.ceil(percentage_to_ranged_value(SPEED_RANGE, percentage))
-            intensity = SPEED_TO_INTENSITY.get(speed, "low")
-            await self.coordinator.async_set_intensity(intensity)
+            intensity = _percentage_to_intensity(percentage)
         # If preset_mode specified, set it
-        elif preset_mode and preset_mode in PRESET_MODES:
-            await self.coordinator.async_set_intensity(preset_mode)
+        elif preset_mode and preset_mode in _PRESET_SET:
+            intensity = preset_mode
+
+        await self._async_turn_on_at(intensity)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the diffuser."""
-        await self.coordinator.async_set_power(False)
+        # Only skip when the cached state is current (see _async_turn_on_at)
+        if self.coordinator.is_on or not self.coordinator.last_update_success:
+            await self.coordinator.async_set_power(False)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the intensity preset mode."""
-        if preset_mode not in PRESET_MODES:
+        if preset_mode not in _PRESET_SET:
             _LOGGER.warning("Invalid preset mode: %s", preset_mode)
             return
 
-        # Turn on if not already on
-        if not self.is_on:
-            await self.coordinator.async_set_power(True)
-
-        await self.coordinator.async_set_intensity(preset_mode)
+        await self._async_turn_on_at(preset_mode)
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage."""
         if percentage == 0:
-            await self.coordinator.async_set_power(False)
+            await self.async_turn_off()
             return
 
         # Convert percentage to intensity level
-        speed = math.ceil(percentage_to_ranged_value(SPEED_RANGE, percentage))
-        intensity = SPEED_TO_INTENSITY.get(speed, "low")
-
-        # Turn on if not already on
-        if not self.is_on:
-            await self.coordinator.async_set_power(True)
-
-        await self.coordinator.async_set_intensity(intensity)
+        await self._async_turn_on_at(_percentage_to_intensity(percentage))
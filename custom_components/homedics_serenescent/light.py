@@ -18,7 +18,7 @@ from homeassistant.components.light import (
     LightEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -35,6 +35,10 @@ EFFECT_LIST = ["solid", "rotating"]
 # Saturation threshold below which we consider the color to be white
 WHITE_SATURATION_THRESHOLD = 25
 
+# Color wheel lookup table resolution (hue bins x saturation bins)
+_HUE_BINS = 64
+_SAT_BINS = 8
+
 
 def _hs_to_rgb(hue: float, saturation: float) -> tuple[int, int, int]:
     """Convert HS color to RGB.
@@ -53,13 +57,68 @@ def _hs_to_rgb(hue: float, saturation: float) -> tuple[int, int, int]:
     return (int(r * 255), int(g * 255), int(b * 255))
 
 
-def _color_distance(rgb1: tuple[int, int, int], rgb2: tuple[int, int, int]) -> float:
-    """Calculate Euclidean distance between two RGB colors."""
-    return math.sqrt(
-        (rgb1[0] - rgb2[0]) ** 2
-        + (rgb1[1] - rgb2[1]) ** 2
-        + (rgb1[2] - rgb2[2]) ** 2
+def _srgb_to_linear(channel: int) -> float:
+    """Convert an sRGB channel (0-255) to linear light (0-1)."""
+    c = channel / 255
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _lab_f(t: float) -> float:
+    """CIE-Lab companding function."""
+    return t ** (1 / 3) if t > 216 / 24389 else (24389 / 27 * t + 16) / 116
+
+
+def _rgb_to_lab(rgb: tuple[int, int, int]) -> tuple[float, float, float]:
+    """Convert an sRGB color to CIE-Lab (D65 white point)."""
+    r, g, b = (_srgb_to_linear(channel) for channel in rgb)
+    fx = _lab_f((0.4124 * r + 0.3576 * g + 0.1805 * b) / 0.95047)
+    fy = _lab_f(0.2126 * r + 0.7152 * g + 0.0722 * b)
+    fz = _lab_f((0.0193 * r + 0.1192 * g + 0.9505 * b) / 1.08883)
+    return (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+
+
+def _lab_hue(rgb: tuple[int, int, int]) -> float:
+    """Return the CIE-LCh hue angle (0-360) of an sRGB color."""
+    _, a, b = _rgb_to_lab(rgb)
+    return math.degrees(math.atan2(b, a)) % 360
+
+
+# Lab hue angle of each device color (white is handled by the saturation check)
+_PALETTE_LAB_HUE = tuple(
+    (color_name, _lab_hue(color_rgb))
+    for color_name, color_rgb in COLOR_RGB_MAP.items()
+    if color_name != "white"
+)
+
+
+def _closest_palette_color(hue: float, saturation: float) -> str:
+    """Find the device color perceptually closest to the given HS values.
+
+    Colors are compared by their CIE-Lab hue angle. Plain RGB distance is
+    skewed by lightness and chroma, which the device can't reproduce anyway,
+    and maps e.g. sky blue to violet. Used to build the lookup table at
+    import; see _find_closest_color.
+    """
+    input_hue = _lab_hue(_hs_to_rgb(hue, saturation))
+
+    def _hue_difference(entry: tuple[str, float]) -> float:
+        difference = abs(entry[1] - input_hue)
+        return min(difference, 360 - difference)
+
+    closest_color, _ = min(_PALETTE_LAB_HUE, key=_hue_difference)
+    return closest_color
+
+
+# Closest device color for the center of each (hue, saturation) bin
+_HS_LUT: tuple[tuple[str, ...], ...] = tuple(
+    tuple(
+        _closest_palette_color(
+            (hue_bin + 0.5) * 360 / _HUE_BINS, (sat_bin + 0.5) * 100 / _SAT_BINS
+        )
+        for sat_bin in range(_SAT_BINS)
     )
+    for hue_bin in range(_HUE_BINS)
+)
 
 
 def _find_closest_color(hue: float, saturation: float) -> str:
@@ -76,22 +135,9 @@ def _find_closest_color(hue: float, saturation: float) -> str:
     if saturation < WHITE_SATURATION_THRESHOLD:
         return "white"
 
-    # Convert input HS to RGB
-    input_rgb = _hs_to_rgb(hue, saturation)
-
-    # Find closest color by RGB distance
-    closest_color = "white"
-    min_distance = float("inf")
-
-    for color_name, color_rgb in COLOR_RGB_MAP.items():
-        if color_name == "white":
-            continue  # Skip white, already handled by saturation check
-        distance = _color_distance(input_rgb, color_rgb)
-        if distance < min_distance:
-            min_distance = distance
-            closest_color = color_name
-
-    return closest_color
+    hue_bin = int(hue * _HUE_BINS / 360) % _HUE_BINS
+    sat_bin = min(int(saturation * _SAT_BINS / 100), _SAT_BINS - 1)
+    return _HS_LUT[hue_bin][sat_bin]
 
 
 async def async_setup_entry(
@@ -123,12 +169,15 @@ class HomedicsSereneScentLight(
     _attr_color_mode = ColorMode.HS
     _attr_supported_features = LightEntityFeature.EFFECT
     _attr_effect_list = EFFECT_LIST
+    # Device has no intensity control for the light
+    _attr_brightness = 255
 
     def __init__(self, coordinator: HomedicsSereneScentCoordinator) -> None:
         """Initialize the light entity."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_light"
         self._attr_device_info = coordinator.device_info
+        self._update_attrs()
 
     @property
     def available(self) -> bool:
@@ -139,33 +188,23 @@ class HomedicsSereneScentLight(
         """
         return self.coordinator.monitoring_enabled
 
-    @property
-    def is_on(self) -> bool:
-        """Return True if light is on (not 'off' color)."""
-        return self.coordinator.color != "off"
-
-    @property
-    def brightness(self) -> int:
-        """Return brightness (always 255 as device has no intensity control for light)."""
-        return 255
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
-    @property
-    def hs_color(self) -> tuple[float, float] | None:
-        """Return the current color as HS values."""
-        color = self.coordinator.color
-        if color in COLOR_HS_MAP:
-            return COLOR_HS_MAP[color]
-        return None
-
-    @property
-    def effect(self) -> str | None:
-        """Return the current effect ('solid' or 'rotating')."""
+    def _update_attrs(self) -> None:
+        """Cache color state so HA reads plain attributes."""
         color = self.coordinator.color
+        self._attr_is_on = color != "off"
+        self._attr_hs_color = COLOR_HS_MAP.get(color)
         if color == "rotating":
-            return "rotating"
-        if color != "off":
-            return "solid"
-        return None
+            self._attr_effect = "rotating"
+        elif color != "off":
+            self._attr_effect = "solid"
+        else:
+            self._attr_effect = None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""